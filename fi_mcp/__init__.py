@@ -7,6 +7,14 @@ Auto-generates MCP tools from the FI function library using introspection.
 __version__ = "0.1.0"
 __author__ = "Brad Busenius"
 
-from .server import app, main
-
 __all__ = ["app", "main"]
+
+
+def __getattr__(name):
+    # Import the server lazily so using the introspection and schema modules
+    # doesn't pull in the MCP server stack and its logging setup
+    if name in __all__:
+        from . import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
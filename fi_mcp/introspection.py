@@ -6,12 +6,59 @@ Handles function discovery, parameter extraction, type conversion, and validatio
 """
 
 import re
-from inspect import cleandoc
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from inspect import Parameter, cleandoc, signature
+from types import UnionType
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    ForwardRef,
+    List,
+    Literal,
+    NamedTuple,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 import fi
 from diablo_utils import functs_from_mod
 
+# Patterns used to parse markdown docstrings. Compiled once at import since
+# parse_markdown_docstring runs for every function during schema generation.
+_ARGS_RE = re.compile(r'### Args:\s*\n(.*?)(?=\n###|\Z)', re.DOTALL)
+_PARAM_RE = re.compile(r'-\s*\*\*(\w+)\*\*:\s*([^\n]+(?:\n(?!\s*-)[^\n]+)*)')
+_RETURNS_RE = re.compile(r'### Returns:\s*\n(.*?)(?=\n###|\Z)', re.DOTALL)
+_WS_RE = re.compile(r'\s+')
+
+# JSON Schema types for plain type annotations and for the origin of
+# generic annotations like List[float] or Dict[str, float]
+_TYPE_MAP = {
+    float: "number",
+    int: "integer",
+    str: "string",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
+_ORIGIN_MAP = {list: "array", tuple: "array", dict: "object"}
+
+# Precedence used to pick a single JSON Schema type for Union annotations
+_UNION_PRIORITY = ("array", "object", "number", "integer", "string", "boolean")
+
+
+class ArgsSpec(NamedTuple):
+    """
+    Flattened function signature with one entry per parameter in each
+    field, in positional order.
+    """
+
+    names: Tuple[str, ...]
+    defaults: Tuple[Any, ...]
+    has_default: Tuple[bool, ...]
+
 
 def get_fi_functions() -> Dict[str, callable]:
     """
@@ -23,9 +70,31 @@ def get_fi_functions() -> Dict[str, callable]:
     return functs_from_mod(fi)
 
 
+def get_args_spec(func: callable) -> ArgsSpec:
+    """
+    Flatten a function signature into an argument spec.
+
+    Resolving the signature is slow, so this is meant to be computed once
+    per function and reused for every call.
+
+    Args:
+        func: The callable function.
+
+    Returns:
+        ArgsSpec with the names, defaults and has-default flags of the
+        function's parameters.
+    """
+    params = signature(func).parameters.values()
+    return ArgsSpec(
+        names=tuple(param.name for param in params),
+        defaults=tuple(param.default for param in params),
+        has_default=tuple(param.default is not Parameter.empty for param in params),
+    )
+
+
 def get_mcp_func_args(
-    fun_params: Dict, mcp_arguments: Dict[str, Any]
-) -> Tuple[bool, List[Any]]:
+    args_spec: ArgsSpec, mcp_arguments: Dict[str, Any]
+) -> Tuple[List[str], List[Any]]:
     """
     Retrieves function arguments from MCP tool arguments.
 
@@ -34,43 +103,47 @@ def get_mcp_func_args(
     these directly without type casting.
 
     Args:
-        fun_params: parameters from an inspect.signature.
+        args_spec: argument spec from get_args_spec.
         mcp_arguments: arguments passed to the MCP tool (already typed).
 
     Returns:
-        A tuple where the first item is a boolean and the second item is a
-        list of arguments to pass to a function. The boolean will be
-        set to True if an expected argument is missing.
+        A tuple where the first item is a list of missing required parameter
+        names (empty if all provided) and the second item is a list of
+        arguments to pass to a function.
     """
+    missing = []
     fun_args = []
-    fail = False
 
-    for key in fun_params.keys():
-        arg_name = fun_params[key].name
+    for arg_name, default, has_default in zip(
+        args_spec.names, args_spec.defaults, args_spec.has_default
+    ):
         arg_passed = mcp_arguments.get(arg_name)
 
         # If argument not provided, check if it has a default
         if arg_passed is None:
-            if fun_params[key].default == fun_params[key].empty:
+            if not has_default:
                 # Required parameter is missing
-                fail = True
-                break
+                missing.append(arg_name)
             else:
                 # Optional parameter - use default
-                fun_args.append(fun_params[key].default)
-                continue
+                fun_args.append(default)
+        else:
+            # MCP arguments are already properly typed from JSON schema
+            # Just use them directly
+            fun_args.append(arg_passed)
 
-        # MCP arguments are already properly typed from JSON schema
-        # Just use them directly
-        fun_args.append(arg_passed)
-
-    return (fail, fun_args)
+    return (missing, fun_args)
 
 
+@lru_cache(maxsize=None)
 def parse_markdown_docstring(docstring: str) -> Dict[str, Any]:
     """
     Parse markdown-formatted docstring into structured sections.
 
+    Results are memoized per docstring, since schema generation looks up
+    every parameter description and the function description separately.
+    The returned dictionary is shared between callers and must not be modified.
+
     Args:
         docstring: Markdown-formatted function docstring.
 
@@ -82,27 +155,29 @@ def parse_markdown_docstring(docstring: str) -> Dict[str, Any]:
 
     cleaned = cleandoc(docstring)
 
-    # Extract description (everything before ### Args:)
-    desc_match = re.match(r'(.*?)(?=###|$)', cleaned, re.DOTALL)
-    description = desc_match.group(1).strip() if desc_match else ""
+    # Extract description (everything before the first ### section)
+    section_start = cleaned.find('###')
+    if section_start >= 0:
+        description = cleaned[:section_start].strip()
+    else:
+        description = cleaned.strip()
 
     # Extract Args section
     args_dict = {}
-    args_match = re.search(r'### Args:\s*\n(.*?)(?=\n###|\Z)', cleaned, re.DOTALL)
+    args_match = _ARGS_RE.search(cleaned)
     if args_match:
         args_text = args_match.group(1)
         # Find all parameter entries: - **param_name**: description
-        param_pattern = r'-\s*\*\*(\w+)\*\*:\s*([^\n]+(?:\n(?!\s*-)[^\n]+)*)'
-        for match in re.finditer(param_pattern, args_text):
+        for match in _PARAM_RE.finditer(args_text):
             param_name = match.group(1)
-            param_desc = re.sub(r'\s+', ' ', match.group(2)).strip()
+            param_desc = _WS_RE.sub(' ', match.group(2)).strip()
             args_dict[param_name] = param_desc
 
     # Extract Returns section
     returns = ""
-    returns_match = re.search(r'### Returns:\s*\n(.*?)(?=\n###|\Z)', cleaned, re.DOTALL)
+    returns_match = _RETURNS_RE.search(cleaned)
     if returns_match:
-        returns = re.sub(r'\s+', ' ', returns_match.group(1)).strip()
+        returns = _WS_RE.sub(' ', returns_match.group(1)).strip()
 
     return {"description": description, "args": args_dict, "returns": returns}
 
@@ -132,52 +207,74 @@ def convert_type_annotation(type_annotation: type) -> str:
     Returns:
         JSON Schema type string.
     """
-    type_str = str(type_annotation)
+    origin = get_origin(type_annotation)
+
+    # Plain types map directly and List[...]/Dict[...]/Tuple[...] by their
+    # origin. Only classes are looked up by hash, since annotations such as
+    # Annotated[int, {'ge': 0}] aren't hashable.
+    if origin is None:
+        json_type = (
+            _TYPE_MAP.get(type_annotation)
+            if isinstance(type_annotation, type)
+            else None
+        )
+    else:
+        json_type = _ORIGIN_MAP.get(origin)
+    if json_type:
+        return json_type
+
+    args = get_args(type_annotation)
+
+    if origin is Literal:
+        # Use the type shared by the literal values, e.g. Literal[1, 2] ->
+        # integer. Mixed values fall back to string.
+        value_types = {_TYPE_MAP.get(type(arg), "string") for arg in args}
+        return value_types.pop() if len(value_types) == 1 else "string"
+    elif origin is Annotated:
+        return convert_type_annotation(args[0])
+    elif origin is Union or origin is UnionType:
+        # Optional[X] maps to X, other unions to their most specific member
+        member_types = {
+            convert_type_annotation(arg) for arg in args if arg is not type(None)
+        }
+        return next((t for t in _UNION_PRIORITY if t in member_types), "string")
+
+    # String annotations come from forward references and code that uses
+    # `from __future__ import annotations` (PEP 563)
+    if isinstance(type_annotation, ForwardRef):
+        type_annotation = type_annotation.__forward_arg__
+    if isinstance(type_annotation, str):
+        return _convert_type_string(type_annotation)
+
+    # Default to string for custom types like Money, Percent, etc.
+    return "string"
+
+
+def _convert_type_string(type_str: str) -> str:
+    """
+    Convert a string type annotation to JSON Schema type.
+
+    Args:
+        type_str: Type annotation as a string, e.g. 'List[float]'.
 
+    Returns:
+        JSON Schema type string.
+    """
     # Check for container types first (before basic types)
     # Otherwise List[float] would match 'float' before 'List'
-    #
-    # Dual checks (type_annotation == float or 'float' in type_str):
-    # - Direct type comparison for standard annotations
-    # - String-based check for string annotations, forward references,
-    #   and code that explicitly uses `from __future__ import annotations`
-    #   (PEP 563 opt-in behavior that makes all annotations strings)
-    # - This is just defensive programming
     if 'List' in type_str or 'list' in type_str:
         return "array"
     elif 'Dict' in type_str or 'dict' in type_str:
         return "object"
     # Handle basic types
-    elif type_annotation == float or 'float' in type_str:
+    elif 'float' in type_str:
         return "number"
-    elif type_annotation == int or 'int' in type_str:
+    elif 'int' in type_str:
         return "integer"
-    elif type_annotation == str or 'str' in type_str:
+    elif 'str' in type_str:
         return "string"
-    elif type_annotation == bool or 'bool' in type_str:
+    elif 'bool' in type_str:
         return "boolean"
     else:
         # Default to string for custom types like Money, Percent, etc.
         return "string"
-
-
-def validate_mcp_arguments(
-    fun_params: Dict, mcp_arguments: Dict[str, Any]
-) -> List[str]:
-    """
-    Validate that all required MCP arguments are provided.
-
-    Args:
-        fun_params: Function parameters from inspect.signature.
-        mcp_arguments: Arguments passed to MCP tool.
-
-    Returns:
-        List of missing required parameter names (empty if all provided).
-    """
-    missing = []
-
-    for param_name, param in fun_params.items():
-        if param.default == param.empty and param_name not in mcp_arguments:
-            missing.append(param_name)
-
-    return missing
@@ -4,10 +4,17 @@ MCP Schema Generator
 Converts FI function signatures to MCP tool schemas automatically.
 """
 
+import hashlib
+import json
 import logging
-import re
+import os
+import sys
+import tempfile
+from contextlib import suppress
 from inspect import signature
-from typing import Any, Dict, List, get_args
+from pathlib import Path
+from types import UnionType
+from typing import Any, Dict, List, Literal, Optional, Union, get_args, get_origin
 
 from .introspection import (
     convert_type_annotation,
@@ -18,6 +25,14 @@ from .introspection import (
 logger = logging.getLogger(__name__)
 
 
+class MissingDocstringError(ValueError):
+    """Raised when a FI function has no docstring."""
+
+
+class NoDescriptionError(ValueError):
+    """Raised when a FI function's docstring has no description section."""
+
+
 def generate_mcp_tool_schema(func_name: str, func: callable) -> Dict[str, Any]:
     """
     Convert a FI function to an MCP tool schema.
@@ -44,19 +59,21 @@ def generate_mcp_tool_schema(func_name: str, func: callable) -> Dict[str, Any]:
         properties[param_name] = {"type": param_type, "description": param_description}
 
         # Handle array types with item specifications
-        annotation_str = str(param.annotation)
         if param_type == "array":
             # Extract item type for List[T] using typing.get_args
-            type_args = get_args(param.annotation)
+            type_args = get_args(_strip_optional(param.annotation))
             if type_args:
                 # Use convert_type_annotation on the extracted type
                 item_type = convert_type_annotation(type_args[0])
                 properties[param_name]["items"] = {"type": item_type}
 
         # Handle special cases for enum/literal types
-        if annotation_str.startswith('typing.Literal'):
-            # Extract literal values for enum
-            literal_values = _extract_literal_values(annotation_str)
+        if get_origin(param.annotation) is Literal:
+            # Extract literal values for enum. Values keep their own type
+            # unless the parameter is exposed as a string.
+            literal_values = _extract_literal_values(param.annotation)
+            if param_type == "string":
+                literal_values = [str(value) for value in literal_values]
             if literal_values:
                 properties[param_name]["enum"] = literal_values
 
@@ -79,31 +96,34 @@ def generate_mcp_tool_schema(func_name: str, func: callable) -> Dict[str, Any]:
     }
 
 
-def _extract_literal_values(type_str: str) -> List[str]:
+def _strip_optional(annotation: Any) -> Any:
     """
-    Extract literal values from a typing.Literal type string.
+    Remove None from an Optional/Union annotation.
 
     Args:
-        type_str: String representation of typing.Literal type.
+        annotation: Python type annotation.
 
     Returns:
-        List of literal values.
+        X for Optional[X], otherwise the annotation unchanged.
     """
-    # Match content inside Literal[...]
-    match = re.search(r'Literal\[(.*?)\]', type_str)
-    if not match:
-        return []
+    if get_origin(annotation) in (Union, UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) == 1:
+            return members[0]
+    return annotation
 
-    # Split by comma and clean up quotes
-    values = match.group(1).split(',')
-    cleaned_values = []
 
-    for value in values:
-        value = value.strip().strip('\'"')
-        if value:
-            cleaned_values.append(value)
+def _extract_literal_values(annotation: Any) -> List[Any]:
+    """
+    Extract literal values from a typing.Literal annotation.
 
-    return cleaned_values
+    Args:
+        annotation: typing.Literal type annotation.
+
+    Returns:
+        List of literal values.
+    """
+    return list(get_args(annotation))
 
 
 def _get_function_description(docstring: str) -> str:
@@ -117,21 +137,44 @@ def _get_function_description(docstring: str) -> str:
         Full description paragraph.
 
     Raises:
-        ValueError: If docstring is missing or has no description.
+        MissingDocstringError: If docstring is missing.
+        NoDescriptionError: If docstring has no description.
     """
     if not docstring:
-        raise ValueError("Function is missing a docstring")
+        raise MissingDocstringError("Function is missing a docstring")
 
     parsed = parse_markdown_docstring(docstring)
     description = parsed["description"]
 
     if not description:
-        raise ValueError("Docstring has no description section")
+        raise NoDescriptionError("Docstring has no description section")
 
     # Normalize whitespace but keep the full description
     return ' '.join(description.split())
 
 
+def _classify_docstring(docstring: str) -> Literal["ok", "missing", "invalid"]:
+    """
+    Validate a docstring with _get_function_description and return the
+    outcome instead of raising.
+
+    Args:
+        docstring: Function's docstring.
+
+    Returns:
+        "missing" if there is no docstring, "invalid" if it has no
+        description section, otherwise "ok".
+    """
+    try:
+        _get_function_description(docstring)
+    except MissingDocstringError:
+        return "missing"
+    except NoDescriptionError:
+        return "invalid"
+
+    return "ok"
+
+
 def generate_all_tool_schemas(
     fi_functions: Dict[str, callable],
 ) -> Dict[str, Dict[str, Any]]:
@@ -146,6 +189,9 @@ def generate_all_tool_schemas(
     """
     schemas = {}
 
+    # Generated serially on purpose: the work is pure Python (regex matching
+    # and signature introspection) and holds the GIL, so a thread pool would
+    # only add overhead.
     for func_name, func in fi_functions.items():
         try:
             schema = generate_mcp_tool_schema(func_name, func)
@@ -159,6 +205,143 @@ def generate_all_tool_schemas(
     return schemas
 
 
+def load_or_generate_tool_schemas(
+    fi_functions: Dict[str, callable], cache_dir: Optional[Path] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Load MCP tool schemas from the on-disk cache, generating them on a miss.
+
+    The cache key covers the Python version and the source of the modules
+    defining the FI functions and of this generator, so upgrading any of
+    them invalidates the cache.
+
+    Args:
+        fi_functions: Dictionary of function names to callables.
+        cache_dir: Directory for cache files. Defaults to
+            $XDG_CACHE_HOME/fi-mcp or ~/.cache/fi-mcp.
+
+    Returns:
+        Dictionary mapping tool names to their schemas.
+    """
+    key = _schema_cache_key(fi_functions)
+    if key is None:
+        return generate_all_tool_schemas(fi_functions)
+
+    cache_path = Path(cache_dir or _default_cache_dir()) / f"schemas-{key}.json"
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            schemas = json.load(f)
+        if _is_valid_schema_cache(schemas, fi_functions):
+            logger.info(f"Loaded tool schemas from {cache_path}")
+            return schemas
+        logger.warning(f"Ignoring invalid schema cache {cache_path}")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable schema cache {cache_path}: {e}")
+
+    schemas = generate_all_tool_schemas(fi_functions)
+
+    # Only cache complete results so schema errors are logged on every startup
+    if len(schemas) == len(fi_functions):
+        _write_schema_cache(cache_path, schemas)
+
+    return schemas
+
+
+def _is_valid_schema_cache(schemas: Any, fi_functions: Dict[str, callable]) -> bool:
+    """
+    Check that cached schemas have one well-formed entry per FI function.
+
+    Args:
+        schemas: Schemas loaded from the cache file.
+        fi_functions: Dictionary of function names to callables.
+
+    Returns:
+        True if the cached schemas can be used as is.
+    """
+    if not isinstance(schemas, dict):
+        return False
+
+    if schemas.keys() != {f"fi_{func_name}" for func_name in fi_functions}:
+        return False
+
+    return all(
+        isinstance(schema, dict)
+        and {"name", "description", "parameters"} <= schema.keys()
+        for schema in schemas.values()
+    )
+
+
+def _default_cache_dir() -> Path:
+    """
+    Get the default directory for the schema cache.
+
+    Returns:
+        Path to the fi-mcp cache directory.
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "fi-mcp"
+
+
+def _schema_cache_key(fi_functions: Dict[str, callable]) -> Optional[str]:
+    """
+    Compute a cache key from the Python version and the source of the
+    modules schemas are built from.
+
+    Args:
+        fi_functions: Dictionary of function names to callables.
+
+    Returns:
+        Hex digest identifying the sources, or None if a source file
+        can't be read.
+    """
+    module_names = {func.__module__ for func in fi_functions.values()}
+    module_names.update((__name__, convert_type_annotation.__module__))
+
+    digest = hashlib.sha256()
+    # Annotation handling depends on typing, which varies between versions
+    digest.update(str(sys.version_info[:2]).encode())
+    digest.update(",".join(fi_functions).encode())
+    try:
+        for module_name in sorted(module_names):
+            module = sys.modules[module_name]
+            digest.update(module_name.encode())
+            digest.update(str(getattr(module, "__version__", "")).encode())
+            digest.update(Path(module.__file__).read_bytes())
+    except (KeyError, AttributeError, TypeError, OSError) as e:
+        logger.debug(f"Schema cache disabled, could not read sources: {e}")
+        return None
+
+    return digest.hexdigest()[:16]
+
+
+def _write_schema_cache(cache_path: Path, schemas: Dict[str, Dict[str, Any]]):
+    """
+    Atomically write schemas to the cache.
+
+    Args:
+        cache_path: Path of the cache file to write.
+        schemas: Dictionary of tool schemas.
+    """
+    temp_name = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as f:
+            temp_name = f.name
+            json.dump(schemas, f)
+        os.replace(temp_name, cache_path)
+        temp_name = None
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write schema cache {cache_path}: {e}")
+    finally:
+        # Don't leave a partial temp file behind if the write failed
+        if temp_name:
+            with suppress(OSError):
+                Path(temp_name).unlink(missing_ok=True)
+
+
 def get_tool_schema_summary(schemas: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
     """
     Get a summary of all tool schemas for debugging/logging.
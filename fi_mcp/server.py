@@ -6,8 +6,9 @@ Main MCP server implementation that auto-generates tools from FI functions.
 
 import asyncio
 import logging
-from inspect import cleandoc, signature
-from typing import Any, Dict
+import sys
+from inspect import cleandoc
+from typing import Any, Dict, Tuple
 
 from mcp.server import Server
 from mcp.server.lowlevel.helper_types import ReadResourceContents
@@ -15,8 +16,13 @@ from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, ServerCapabilities, TextContent, Tool
 
-from .introspection import get_fi_functions, get_mcp_func_args, validate_mcp_arguments
-from .schema_generator import generate_all_tool_schemas, get_tool_schema_summary
+from .introspection import (
+    ArgsSpec,
+    get_args_spec,
+    get_fi_functions,
+    get_mcp_func_args,
+)
+from .schema_generator import get_tool_schema_summary, load_or_generate_tool_schemas
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -36,28 +42,43 @@ app = Server("fi-mcp")
 # 4. The server runs as a single-process daemon with no concurrent modifications
 fi_functions: Dict[str, callable] = {}
 tool_schemas: Dict[str, Dict[str, Any]] = {}
+tool_dispatch: Dict[str, Tuple[callable, ArgsSpec]] = {}
+cached_tools: list[Tool] = []
+cached_resources: list[Resource] = []
+help_contents: Dict[str, list[ReadResourceContents]] = {}
+help_contents_all: list[ReadResourceContents] = []
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
+def _build_tools(schemas: Dict[str, Dict[str, Any]]) -> list[Tool]:
     """
-    List all available FI tools.
+    Build Tool objects for all FI tool schemas.
+
+    Args:
+        schemas: Dictionary of tool schemas.
 
     Returns:
-        List of Tool objects for all FI functions.
+        List of Tool objects.
     """
-    tools = []
-
-    for tool_name, schema in tool_schemas.items():
-        tool = Tool(
+    return [
+        Tool(
             name=schema["name"],
             description=schema["description"],
             inputSchema=schema["parameters"],
         )
-        tools.append(tool)
+        for schema in schemas.values()
+    ]
+
 
-    logger.info(f"Listed {len(tools)} FI tools")
-    return tools
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """
+    List all available FI tools.
+
+    Returns:
+        List of Tool objects for all FI functions.
+    """
+    logger.info(f"Listed {len(cached_tools)} FI tools")
+    return cached_tools
 
 
 def _format_function_name(func_name: str) -> str:
@@ -127,18 +148,20 @@ def _create_resource_contents(content: str) -> list[ReadResourceContents]:
     return [ReadResourceContents(content=content, mime_type="text/markdown")]
 
 
-@app.list_resources()
-async def list_resources() -> list[Resource]:
+def _build_resources(functions: Dict[str, callable]) -> list[Resource]:
     """
-    List all available help resources.
+    Build help Resource objects for all FI functions.
+
+    Args:
+        functions: Dictionary of function names to callables.
 
     Returns:
-        List of Resource objects for FI function documentation.
+        List of Resource objects, including the combined help resource.
     """
     resources = []
 
     # Add individual function help resources
-    for func_name in fi_functions.keys():
+    for func_name in functions.keys():
         resource = Resource(
             uri=f"fi://help/{func_name}",
             name=f"Help: {func_name}",
@@ -157,10 +180,61 @@ async def list_resources() -> list[Resource]:
         )
     )
 
-    logger.info(f"Listed {len(resources)} help resources")
     return resources
 
 
+def _build_help_contents(
+    functions: Dict[str, callable],
+) -> Dict[str, list[ReadResourceContents]]:
+    """
+    Render the help resource contents for each FI function.
+
+    Args:
+        functions: Dictionary of function names to callables.
+
+    Returns:
+        Dictionary mapping function names to their resource contents.
+    """
+    return {
+        func_name: _create_resource_contents(
+            _format_function_help(func_name, func, heading_level=1)
+        )
+        for func_name, func in functions.items()
+    }
+
+
+def _build_all_help_contents(
+    functions: Dict[str, callable],
+) -> list[ReadResourceContents]:
+    """
+    Render the combined help resource contents for all FI functions.
+
+    Args:
+        functions: Dictionary of function names to callables.
+
+    Returns:
+        List containing single ReadResourceContents object.
+    """
+    all_help = [
+        _format_function_help(name, func, heading_level=2)
+        for name, func in sorted(functions.items())
+    ]
+    content = "\n\n---\n\n".join(all_help)
+    return _create_resource_contents(content)
+
+
+@app.list_resources()
+async def list_resources() -> list[Resource]:
+    """
+    List all available help resources.
+
+    Returns:
+        List of Resource objects for FI function documentation.
+    """
+    logger.info(f"Listed {len(cached_resources)} help resources")
+    return cached_resources
+
+
 @app.read_resource()
 async def read_resource(uri: str) -> list[ReadResourceContents]:
     """
@@ -183,17 +257,10 @@ async def read_resource(uri: str) -> list[ReadResourceContents]:
     func_name = uri_str.replace("fi://help/", "")
 
     if func_name == "all":
-        all_help = [
-            _format_function_help(name, func, heading_level=2)
-            for name, func in sorted(fi_functions.items())
-        ]
-        content = "\n\n---\n\n".join(all_help)
-        return _create_resource_contents(content)
-
-    elif func_name in fi_functions:
-        func = fi_functions[func_name]
-        content = _format_function_help(func_name, func, heading_level=1)
-        return _create_resource_contents(content)
+        return help_contents_all
+
+    elif func_name in help_contents:
+        return help_contents[func_name]
 
     else:
         raise ValueError(f"Unknown function: {func_name}")
@@ -213,33 +280,22 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """
     logger.info(f"Calling tool: {name} with arguments: {arguments}")
 
-    # Remove 'fi_' prefix to get function name
-    if not name.startswith('fi_'):
-        raise ValueError(f"Invalid tool name: {name}")
-
-    func_name = name[3:]  # Remove 'fi_' prefix
-
-    if func_name not in fi_functions:
-        raise ValueError(f"Unknown function: {func_name}")
+    # Resolve the function and its argument spec with a single lookup
+    dispatch = tool_dispatch.get(name)
+    if dispatch is None:
+        if not name.startswith('fi_'):
+            raise ValueError(f"Invalid tool name: {name}")
+        raise ValueError(f"Unknown function: {name[3:]}")  # Remove 'fi_' prefix
 
-    function_to_call = fi_functions[func_name]
+    function_to_call, args_spec = dispatch
 
     try:
-        # Get function signature
-        sig = signature(function_to_call)
-        fun_params = sig.parameters
-
-        # Validate required arguments
-        missing_args = validate_mcp_arguments(fun_params, arguments)
+        # Collect arguments and validate required ones in a single pass
+        missing_args, fun_args = get_mcp_func_args(args_spec, arguments)
         if missing_args:
             error_msg = f"Missing required arguments: {', '.join(missing_args)}"
             return [TextContent(type="text", text=f"Error: {error_msg}")]
 
-        # Convert arguments to proper types
-        fail, fun_args = get_mcp_func_args(fun_params, arguments)
-        if fail:
-            return [TextContent(type="text", text="Error: Failed to convert arguments")]
-
         # Call the FI function
         result = function_to_call(*fun_args)
 
@@ -259,7 +315,8 @@ def initialize_server():
     """
     Initialize the server by discovering FI functions and generating schemas.
     """
-    global fi_functions, tool_schemas
+    global fi_functions, tool_schemas, tool_dispatch
+    global cached_tools, cached_resources, help_contents, help_contents_all
 
     logger.info("Initializing FI-MCP server...")
 
@@ -267,10 +324,32 @@ def initialize_server():
     fi_functions = get_fi_functions()
     logger.info(f"Discovered {len(fi_functions)} FI functions")
 
-    # Generate MCP tool schemas
-    tool_schemas = generate_all_tool_schemas(fi_functions)
+    # FI function docstrings are the source of tool descriptions and help
+    if sys.flags.optimize >= 2:
+        logger.warning(
+            "Python is running with -OO, which strips docstrings. Tool schemas "
+            "can only be loaded from the schema cache and help will be empty."
+        )
+
+    # Map tool names to functions and argument specs up front so tool calls
+    # don't pay for name parsing or inspect.signature
+    tool_dispatch = {
+        f"fi_{func_name}": (func, get_args_spec(func))
+        for func_name, func in fi_functions.items()
+    }
+
+    # Generate MCP tool schemas, reusing the on-disk cache when it's current
+    tool_schemas = load_or_generate_tool_schemas(fi_functions)
     logger.info(f"Generated {len(tool_schemas)} tool schemas")
 
+    # Tools and resources never change after startup, so build them once
+    cached_tools = _build_tools(tool_schemas)
+    cached_resources = _build_resources(fi_functions)
+
+    # Render help documentation once instead of on every resource read
+    help_contents = _build_help_contents(fi_functions)
+    help_contents_all = _build_all_help_contents(fi_functions)
+
     # Log summary
     summary = get_tool_schema_summary(tool_schemas)
     for tool_name, info in summary.items():
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for FI-MCP tests
+"""
+
+from functools import lru_cache
+
+import pytest
+
+from fi_mcp.introspection import get_fi_functions
+
+
+@lru_cache(maxsize=None)
+def _sorted_fi_items():
+    """Discover all FI functions once as (name, function) pairs sorted by name"""
+    return tuple(sorted(get_fi_functions().items()))
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize tests that take fi_item with every FI function"""
+    if "fi_item" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "fi_item",
+            [pytest.param(item, id=item[0]) for item in _sorted_fi_items()],
+        )
+
+
+@pytest.fixture(scope="session")
+def fi_functions():
+    """Fixture that discovers all FI functions once per test session"""
+    return dict(_sorted_fi_items())
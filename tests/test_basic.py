@@ -4,19 +4,21 @@ Basic integration tests for FI-MCP functionality
 """
 
 from decimal import Decimal
-from inspect import signature
+from typing import Annotated, Dict, List, Literal, Optional, Union
 
 import fi
-import pytest
 
-from fi_mcp.introspection import get_fi_functions, get_mcp_func_args
-from fi_mcp.schema_generator import generate_all_tool_schemas, generate_mcp_tool_schema
-
-
-@pytest.fixture(scope="module")
-def fi_functions():
-    """Fixture that discovers all FI functions once per module"""
-    return get_fi_functions()
+from fi_mcp import schema_generator
+from fi_mcp.introspection import (
+    convert_type_annotation,
+    get_args_spec,
+    get_mcp_func_args,
+)
+from fi_mcp.schema_generator import (
+    generate_all_tool_schemas,
+    generate_mcp_tool_schema,
+    load_or_generate_tool_schemas,
+)
 
 
 def test_function_discovery(fi_functions):
@@ -53,11 +55,105 @@ def test_schema_generation(fi_functions):
     assert 'annual_rate' in required_params, "annual_rate should be required"
 
 
+def test_type_annotation_conversion():
+    """Test conversion of Python type annotations to JSON Schema types"""
+    assert convert_type_annotation(float) == 'number'
+    assert convert_type_annotation(int) == 'integer'
+    assert convert_type_annotation(List[float]) == 'array'
+    assert convert_type_annotation(Dict[str, float]) == 'object'
+    assert convert_type_annotation(Optional[List[float]]) == 'array'
+    assert convert_type_annotation(Optional[int]) == 'integer'
+    assert convert_type_annotation(Union[int, float]) == 'number'
+    assert convert_type_annotation(Literal['print', 'paint']) == 'string'
+    assert convert_type_annotation(Literal[1, 2]) == 'integer'
+    assert convert_type_annotation(Literal[True]) == 'boolean'
+    assert convert_type_annotation(Literal['a', 1]) == 'string'
+    assert convert_type_annotation('List[float]') == 'array'
+    assert convert_type_annotation(Decimal) == 'string'
+    assert convert_type_annotation(Annotated[int, {'ge': 0}]) == 'integer'
+    assert convert_type_annotation(List[Annotated[float, {'ge': 0}]]) == 'array'
+
+
+def test_optional_array_parameter_items():
+    """Test that Optional[List[T]] parameters describe T as the item type"""
+
+    def total(amounts: Optional[List[float]] = None) -> float:
+        """Total the amounts."""
+        return sum(amounts or [])
+
+    schema = generate_mcp_tool_schema('total', total)
+    amounts_param = schema['parameters']['properties']['amounts']
+    assert amounts_param['type'] == 'array', "Optional list should be array type"
+    assert amounts_param['items'] == {'type': 'number'}, "Items should be numbers"
+
+
+def test_literal_parameter_enum():
+    """Test that Literal parameters produce an enum of their values"""
+
+    def pick(choice: Literal["it's", 'x']) -> str:
+        """Pick a choice."""
+        return choice
+
+    schema = generate_mcp_tool_schema('pick', pick)
+    choice_param = schema['parameters']['properties']['choice']
+    assert choice_param['type'] == 'string', "Literal of str should be string type"
+    assert choice_param['enum'] == ["it's", 'x'], "Enum should keep quotes in values"
+
+
+def test_non_string_literal_parameter_enum():
+    """Test that non-string Literal enums keep the values' types"""
+
+    def pick(periods: Literal[1, 12], mixed: Literal['a', 1]) -> int:
+        """Pick periods."""
+        return periods
+
+    properties = generate_mcp_tool_schema('pick', pick)['parameters']['properties']
+    assert properties['periods']['type'] == 'integer', "Literal of int is integer"
+    assert properties['periods']['enum'] == [1, 12], "Enum values should be ints"
+    assert properties['mixed']['type'] == 'string', "Mixed Literal is string"
+    assert properties['mixed']['enum'] == ['a', '1'], "Mixed enum is stringified"
+
+
+def test_schema_cache(fi_functions, tmp_path, monkeypatch):
+    """Test that generated schemas are cached on disk and reloaded"""
+    schemas = load_or_generate_tool_schemas(fi_functions, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob('schemas-*.json'))) == 1, "Should write cache file"
+
+    def fail_generation(fi_functions):
+        raise AssertionError("Schemas should be loaded from the cache")
+
+    monkeypatch.setattr(schema_generator, 'generate_all_tool_schemas', fail_generation)
+    cached = load_or_generate_tool_schemas(fi_functions, cache_dir=tmp_path)
+    assert cached == schemas, "Cached schemas should match generated schemas"
+
+
+def test_invalid_schema_cache_is_regenerated(fi_functions, tmp_path):
+    """Test that malformed cache files are treated as a cache miss"""
+    schemas = load_or_generate_tool_schemas(fi_functions, cache_dir=tmp_path)
+    (cache_path,) = tmp_path.glob('schemas-*.json')
+
+    for bad_content in ('[]', '{"fi_x": {}}'):
+        cache_path.write_text(bad_content, encoding='utf-8')
+        regenerated = load_or_generate_tool_schemas(fi_functions, cache_dir=tmp_path)
+        assert regenerated == schemas, "Invalid cache should be regenerated"
+
+
+def test_schema_cache_write_failure(tmp_path, monkeypatch):
+    """Test that a failed cache write leaves no temp file behind"""
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(schema_generator.os, 'replace', fail_replace)
+    schema_generator._write_schema_cache(tmp_path / 'schemas-test.json', {})
+    assert list(tmp_path.iterdir()) == [], "Temp file should be removed"
+
+
 def test_specific_function():
     """Test calling a specific FI function with argument conversion"""
     # Test future_value function
     func = fi.future_value
-    sig = signature(func)
+    args_spec = get_args_spec(func)
 
     # Mock MCP arguments
     mcp_args = {
@@ -67,9 +163,9 @@ def test_specific_function():
         'years': 10,
     }
 
-    fail, converted_args = get_mcp_func_args(sig.parameters, mcp_args)
+    missing, converted_args = get_mcp_func_args(args_spec, mcp_args)
 
-    assert not fail, "Argument conversion should succeed"
+    assert not missing, "Argument conversion should succeed"
     assert len(converted_args) > 0, "Should have converted arguments"
     assert len(converted_args) >= len(
         mcp_args
@@ -81,6 +177,17 @@ def test_specific_function():
     assert isinstance(result, (int, float, Decimal)), "Result should be numeric"
 
 
+def test_missing_required_arguments():
+    """Test that every missing required argument is reported"""
+    args_spec = get_args_spec(fi.future_value)
+
+    missing, _ = get_mcp_func_args(args_spec, {'present_value': 1000})
+
+    assert 'annual_rate' in missing, "annual_rate should be reported missing"
+    assert 'years' in missing, "years should be reported missing"
+    assert 'present_value' not in missing, "present_value was provided"
+
+
 def test_array_parameter_handling():
     """Test that array parameters are correctly handled in schema and function calls"""
     # Test schema generation for function with List parameter
@@ -94,16 +201,16 @@ def test_array_parameter_handling():
     assert taxes_param['items']['type'] == 'number', "Array items should be number type"
 
     # Test calling the function with array argument
-    sig = signature(func)
+    args_spec = get_args_spec(func)
     mcp_args = {
         'gross_pay': 8528,
         'employer_match': 652,
         'taxes_and_fees': [712, 100, 50.0],
     }
 
-    fail, converted_args = get_mcp_func_args(sig.parameters, mcp_args)
+    missing, converted_args = get_mcp_func_args(args_spec, mcp_args)
 
-    assert not fail, "Argument conversion should succeed with array parameter"
+    assert not missing, "Argument conversion should succeed with array parameter"
     assert len(converted_args) == 3, "Should have 3 converted arguments"
     assert isinstance(converted_args[2], list), "Third argument should be a list"
     assert len(converted_args[2]) == 3, "List should have 3 items"